@@ -7,7 +7,8 @@ class DataProcessor:
 
     Attributes:
         files (list of str): List of text filenames that have been read
-        time_values (np.array): Array of time values from all files
+        time_values (np.array): Array of time values from all files,
+            sorted in ascending order
         energy_values (np.array): Array of energy values from all files
     """
 
@@ -61,6 +62,8 @@ class DataProcessor:
         """
         Calculate the count rate in a given time bin for the
         time values stored in the data processor.
+        ``time_values`` is expected to be sorted in ascending order (as done
+        by ``add_file``), otherwise a slower ``np.histogram`` is used.
 
         Args:
             bin_time (float): the time bin width in seconds
@@ -71,8 +74,8 @@ class DataProcessor:
             np.array: Array of count rates (counts per second)
             np.array: Array of time bin edges (in seconds)
         """
-        time_values = self.time_values.copy()
-        energy_values = self.energy_values.copy()
+        time_values = self.time_values
+        energy_values = self.energy_values
 
         time_bins = np.arange(0, time_values[-2], bin_time)
 
@@ -82,10 +85,24 @@ class DataProcessor:
             )
             time_values = time_values[peak_mask]
 
-        count_rates, count_rate_bins = np.histogram(time_values, bins=time_bins)
-        count_rates = count_rates / bin_time
+        if time_bins.size == 0:
+            return np.zeros(0), time_bins
+
+        if np.any(time_values[1:] < time_values[:-1]):
+            # unsorted time values (eg. set directly by the user)
+            counts, _ = np.histogram(time_values, bins=time_bins)
+            return counts / bin_time, time_bins
+
+        # time values are sorted so the counts per bin are obtained by
+        # locating the bin edges in the time values, which avoids the sort
+        # np.histogram does on the whole array
+        edges_idx = np.searchsorted(time_values, time_bins, side="left")
+        # the last bin is closed on the right, as in np.histogram
+        edges_idx[-1] = np.searchsorted(time_values, time_bins[-1], side="right")
+
+        count_rates = np.diff(edges_idx) / bin_time
 
-        return count_rates, count_rate_bins
+        return count_rates, time_bins
 
     def get_avg_rate(self, t_min: float, t_max: float, energy_window: tuple = None):
         """
@@ -143,3 +143,56 @@ def test_get_count_rate(tmpdir):
     assert np.allclose(count_rates_peak2, expected_count_rate_peak2, rtol=0.1)
 
     assert len(count_rate_bins_total) == total_time_s / bin_time
+
+
+@pytest.mark.parametrize("no_bins", [False, True])
+@pytest.mark.parametrize("energy_window", [None, (0.2, 0.7)])
+@pytest.mark.parametrize("bin_time", [0.1, 1, 3.7])
+def test_get_count_rate_matches_histogram(bin_time, energy_window, no_bins):
+    if no_bins:
+        # time_values[-2] <= 0 so there are no time bins
+        time_values = np.zeros(3)
+    else:
+        time_values = np.sort(np.random.rand(10000) * 100)
+        # add events exactly on the bin edges
+        time_values = np.sort(
+            np.concatenate((time_values, np.arange(0, 90, bin_time)))
+        )
+    energy_values = np.random.rand(len(time_values))
+
+    processor = DataProcessor()
+    processor.time_values = time_values
+    processor.energy_values = energy_values
+
+    count_rates, count_rate_bins = processor.get_count_rate(
+        bin_time=bin_time, energy_window=energy_window
+    )
+
+    expected_bins = np.arange(0, time_values[-2], bin_time)
+    if energy_window is not None:
+        peak_mask = (energy_values > energy_window[0]) & (
+            energy_values < energy_window[1]
+        )
+        time_values = time_values[peak_mask]
+    expected_counts, _ = np.histogram(time_values, bins=expected_bins)
+
+    assert np.array_equal(count_rate_bins, expected_bins)
+    assert np.array_equal(count_rates, expected_counts / bin_time)
+
+
+def test_get_count_rate_unsorted():
+    time_values = np.array([5, 1, 3, 2, 9, 0.5, 8, 7.5, 6.2, 0.1, 9.5, 9.9])
+
+    processor = DataProcessor()
+    processor.time_values = time_values
+    processor.energy_values = np.ones_like(time_values)
+
+    count_rates, count_rate_bins = processor.get_count_rate(bin_time=1)
+
+    expected_counts, expected_bins = np.histogram(
+        time_values, bins=np.arange(0, time_values[-2], 1)
+    )
+
+    assert np.array_equal(count_rate_bins, expected_bins)
+    assert np.array_equal(count_rates, expected_counts)
+